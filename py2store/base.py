@@ -24,9 +24,11 @@ This means that you don't have to implement these as all, and can choose to impl
 the storage methods themselves.
 """
 
-from collections.abc import MutableMapping
+from collections.abc import Mapping, MutableMapping
 from typing import Any, Iterable, Tuple
 
+from py2store.util import count_iter
+
 Key = Any
 Val = Any
 Id = Any
@@ -37,15 +39,66 @@ ValIter = Iterable[Val]
 ItemIter = Iterable[Item]
 
 
+def _len_from_backend_count(self):
+    return self._backend_count()
+
+
+def _contains_from_backend_exists(self, k):
+    return self._backend_exists(k)
+
+
 # TODO: Wishful thinking: Define store type so the type is defined by it's methods, not by subclassing.
 class Persister(MutableMapping):
-    """ Acts as a MutableMapping abc, but disabling the clear method, and computing __len__ by counting keys"""
+    """ Acts as a MutableMapping abc, but disabling the clear method, and computing __len__ by counting keys.
+
+    Counting keys (and checking containment through __getitem__) is the fallback. If the backend has a more direct
+    way to do it (a COUNT(*), a SCARD, an EXISTS...), subclasses can define a _backend_count() and/or a
+    _backend_exists(k) method, which will then be used as the __len__ and/or __contains__
+    (unless the subclass, or a class placed before Persister in the mro, defines its own).
+
+    Persister has an empty __slots__, so concrete subclasses that declare their own __slots__ (as should all the
+    classes between them and Persister) get no per instance __dict__.
+
+    >>> class CountingDictPersister(Persister):
+    ...     def __init__(self, d):
+    ...         self.d = d
+    ...     def __getitem__(self, k):
+    ...         return self.d[k]
+    ...     def __setitem__(self, k, v):
+    ...         self.d[k] = v
+    ...     def __delitem__(self, k):
+    ...         del self.d[k]
+    ...     def __iter__(self):
+    ...         print("iterating...")
+    ...         return iter(self.d)
+    ...
+    >>> p = CountingDictPersister({'a': 1, 'b': 2})
+    >>> len(p)
+    iterating...
+    2
+    >>> class BackendCountingDictPersister(CountingDictPersister):
+    ...     def _backend_count(self):
+    ...         return len(self.d)
+    ...     def _backend_exists(self, k):
+    ...         return k in self.d
+    ...
+    >>> p = BackendCountingDictPersister({'a': 1, 'b': 2})
+    >>> len(p)
+    2
+    >>> 'a' in p, 'c' in p
+    (True, False)
+    """
+    __slots__ = ()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        if cls.__len__ is Persister.__len__ and hasattr(cls, '_backend_count'):
+            cls.__len__ = _len_from_backend_count
+        if cls.__contains__ is Mapping.__contains__ and hasattr(cls, '_backend_exists'):
+            cls.__contains__ = _contains_from_backend_exists
 
     def __len__(self):
-        count = 0
-        for _ in self.__iter__():
-            count += 1
-        return count
+        return count_iter(self.__iter__())
 
     def clear(self):
         raise NotImplementedError('''
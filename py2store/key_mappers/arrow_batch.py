@@ -0,0 +1,49 @@
+"""
+Vectorized (pyarrow) versions of the batch dsv key mappers of py2store.key_mappers.tuples.
+Useful when you have a lot of keys to parse at once (e.g. a column of keys), and are okay working with arrow arrays.
+"""
+
+from py2store.util import ModuleNotFoundErrorNiceMessage
+
+with ModuleNotFoundErrorNiceMessage():
+    import pyarrow as pa
+    import pyarrow.compute as pc
+
+
+def _ensure_string_array(strings):
+    if isinstance(strings, (pa.Array, pa.ChunkedArray)):
+        return strings
+    return pa.array(strings, type=pa.string())
+
+
+def lists_of_dsvs(dsvs, sep=','):
+    """
+    Vectorized version of py2store.key_mappers.tuples.lists_of_dsvs.
+    As there, an empty string gives an empty list. The separator is taken literally (not as a regex).
+    :param dsvs: an iterable (or arrow array, chunked or not) of dsv strings
+    :param sep: the separator
+    :return: an arrow ListArray of the string elements of each dsv string
+    >>> lists_of_dsvs(['Mic/Bob', 'Ann', ''], sep='/').to_pylist()
+    [['Mic', 'Bob'], ['Ann'], []]
+    >>> lists_of_dsvs(['a.b', 'c'], sep='.').to_pylist()
+    [['a', 'b'], ['c']]
+    >>> lists_of_dsvs(pa.chunked_array([['Mic/Bob', ''], ['Ann']]), sep='/').to_pylist()
+    [['Mic', 'Bob'], [], ['Ann']]
+    """
+    dsvs = _ensure_string_array(dsvs)
+    lists = pc.split_pattern(dsvs, pattern=sep)
+    return pc.if_else(pc.equal(dsvs, ''), pa.scalar([], type=lists.type), lists)
+
+
+def dsvs_of_lists(lists, sep=','):
+    """
+    Vectorized version of py2store.key_mappers.tuples.dsvs_of_lists.
+    :param lists: an iterable of lists of strings (or an arrow ListArray of strings)
+    :param sep: the separator
+    :return: an arrow StringArray of dsv strings
+    >>> dsvs_of_lists([['Mic', 'Bob'], ['Ann'], []], sep='/').to_pylist()
+    ['Mic/Bob', 'Ann', '']
+    """
+    if not isinstance(lists, (pa.Array, pa.ChunkedArray)):
+        lists = pa.array(lists, type=pa.list_(pa.string()))
+    return pc.binary_join(lists, sep)
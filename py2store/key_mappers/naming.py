@@ -420,7 +420,7 @@ class LinearNaming(object):
         's3://uploads/GROUP/upload/files/USER/DAY/SUBUSER/'
         """
         assert len(args) + len(kwargs) <= self.n_names, "You have too many arguments"
-        kwargs = dict({k: v for k, v in zip(self.names, args)}, **kwargs)
+        kwargs = dict(zip(self.names, args), **kwargs)
         if self.process_kwargs is not None:
             kwargs = self.process_kwargs(**kwargs)
 
@@ -453,7 +453,7 @@ class LinearNaming(object):
         's3://bucket-GROUP/example/files/USER/SUBUSER/2017-01-24/1485272231982_1485261448469'
         """
         assert len(args) + len(kwargs) == self.n_names, "You're missing, or have too many arguments"
-        kwargs = dict({k: v for k, v in zip(self.names, args)}, **kwargs)
+        kwargs = dict(zip(self.names, args), **kwargs)
         if self.process_kwargs is not None:
             kwargs = self.process_kwargs(**kwargs)
         return self.template.format(**kwargs)
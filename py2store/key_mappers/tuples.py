@@ -0,0 +1,603 @@
+"""
+Key mappers between tuple, dict, and string representations of (structured) keys.
+
+The one-shot functions (e.g. str_of_tuple) take the schema (format, fields, regex...) as an argument.
+The mk_* factories take the schema once, and return a function of the key only, which is what you want to
+use as (or in) a _id_of_key or _key_of_id, since it's called on every store access.
+"""
+
+import re
+import random
+import string
+import sys
+from itertools import accumulate
+from operator import itemgetter
+from string import Formatter
+
+from py2store.errors import KeyValidationError
+
+
+def str_of_tuple(t, str_format):
+    """
+    Make a string from a tuple, using str_format.
+    :param t: the tuple of values to fill the format with
+    :param str_format: a (positional) str.format template
+    :return: the formatted string
+    >>> str_of_tuple(('Mic', 'Bob'), '{}/{}.txt')
+    'Mic/Bob.txt'
+    """
+    try:
+        return str_format.format(*t)
+    except Exception as e:
+        raise KeyValidationError(e)
+
+
+def str_of_dict(d, str_format):
+    """
+    Make a string from a dict, using str_format.
+    :param d: the dict of field:value pairs to fill the format with
+    :param str_format: a (named fields) str.format template
+    :return: the formatted string
+    >>> str_of_dict({'dir': 'Mic', 'name': 'Bob'}, '{dir}/{name}.txt')
+    'Mic/Bob.txt'
+    """
+    try:
+        return str_format.format(**d)
+    except Exception as e:
+        raise KeyValidationError(e)
+
+
+def mk_str_of_tuple(str_format):
+    """
+    Make a str_of_tuple function for a fixed str_format.
+    :param str_format: a (positional) str.format template
+    :return: a function that formats a tuple into a string
+    >>> str_of_tuple = mk_str_of_tuple('{}/{}.txt')
+    >>> str_of_tuple(('Mic', 'Bob'))
+    'Mic/Bob.txt'
+    >>> try:
+    ...     str_of_tuple(('Mic',))
+    ... except KeyValidationError:
+    ...     print("not enough elements")
+    not enough elements
+    """
+    _format = str_format.format
+
+    def _str_of_tuple(t):
+        try:
+            return _format(*t)
+        except Exception as e:
+            raise KeyValidationError(e)
+
+    return _str_of_tuple
+
+
+def mk_str_of_dict(str_format):
+    """
+    Make a str_of_dict function for a fixed str_format.
+    :param str_format: a (named fields) str.format template
+    :return: a function that formats a dict into a string
+    >>> str_of_dict = mk_str_of_dict('{dir}/{name}.txt')
+    >>> str_of_dict({'dir': 'Mic', 'name': 'Bob'})
+    'Mic/Bob.txt'
+    >>> try:
+    ...     str_of_dict({'dir': 'Mic'})
+    ... except KeyValidationError:
+    ...     print("missing a field")
+    missing a field
+    """
+    _format = str_format.format
+
+    def _str_of_dict(d):
+        try:
+            return _format(**d)
+        except Exception as e:
+            raise KeyValidationError(e)
+
+    return _str_of_dict
+
+
+def mk_compiled_str_of_dict(str_format):
+    """
+    Make a str_of_dict function for a fixed str_format, by generating (and compiling) a function whose body is an
+    f-string equivalent to the str_format. This avoids the (**d) unpacking and the parsing of the str_format that
+    str.format does on every call, making it a few times faster than mk_str_of_dict's function.
+    Only plain (identifier) field names, and format specs without nested fields are handled that way: For other
+    str_formats (e.g. '{0}', '{a.b}', '{a[0]}' or '{a:{width}}'), mk_str_of_dict's function is returned.
+    :param str_format: a (named fields) str.format template
+    :return: a function that formats a dict into a string
+    >>> str_of_dict = mk_compiled_str_of_dict('{dir}/{name}_{i:03d}.txt')
+    >>> str_of_dict({'dir': 'Mic', 'name': 'Bob', 'i': 7})
+    'Mic/Bob_007.txt'
+    >>> mk_compiled_str_of_dict("{{'{name!r}'}}")({'name': 'Bob'})  # escaped braces, quotes, and conversions are fine
+    "{''Bob''}"
+    >>> try:
+    ...     str_of_dict({'dir': 'Mic', 'name': 'Bob'})
+    ... except KeyValidationError:
+    ...     print("missing a field")
+    missing a field
+    """
+    fstring_parts = []
+    fields = []
+    for literal, field, spec, conversion in Formatter().parse(str_format):
+        fstring_parts.append(literal.replace('{', '{{').replace('}', '}}'))
+        if field is None:
+            continue
+        if not field.isidentifier() or '{' in spec:
+            return mk_str_of_dict(str_format)
+        fstring_parts.append(
+            '{d[_k' + str(len(fields)) + ']' + (f'!{conversion}' if conversion else '') + (f':{spec}' if spec else '')
+            + '}')
+        fields.append(field)
+
+    field_args = ''.join(f", _k{i}=_k{i}" for i in range(len(fields)))
+    src = (f"def _str_of_dict(d{field_args}):\n"
+           f"    try:\n"
+           f"        return f{''.join(fstring_parts)!r}\n"
+           f"    except Exception as e:\n"
+           f"        raise KeyValidationError(e)\n")
+    namespace = dict({f"_k{i}": field for i, field in enumerate(fields)}, KeyValidationError=KeyValidationError)
+    exec(src, namespace)
+    return namespace['_str_of_dict']
+
+
+_interned_fields = {}
+
+
+def _intern_fields(fields):
+    """
+    Get the canonical tuple of (sys.intern'ed) string fields, so that factories made with the same fields share
+    the same tuple and field name strings.
+    Only all-str fields are interned: Others are just made into a tuple, since equal but different fields
+    (e.g. 1, 1.0 and True) would otherwise get mixed up.
+    Note: A weakref.WeakValueDictionary can't be used here, as tuples can't be weakly referenced. As with sys.intern,
+    the canonical tuples are kept for the life of the process (schemas are few, so that's fine).
+    >>> _intern_fields(['dir', 'name']) is _intern_fields(('dir', 'name'))
+    True
+    >>> _intern_fields([1]), _intern_fields([True])
+    ((1,), (True,))
+    """
+    fields = tuple(fields)
+    if not all(type(f) is str for f in fields):
+        return fields
+    fields = tuple(map(sys.intern, fields))
+    return _interned_fields.setdefault(fields, fields)
+
+
+def tuple_of_dict(d, fields):
+    """
+    Make a tuple from a dict, taking the values of the fields, in order.
+    :param d: a dict containing exactly the fields as keys
+    :param fields: the (ordered) fields to extract
+    :return: the tuple of values
+    >>> tuple_of_dict({'name': 'Bob', 'dir': 'Mic'}, ('dir', 'name'))
+    ('Mic', 'Bob')
+    >>> tuple_of_dict({'name': 'Bob', 'dir': 'Mic'}, (f for f in ['dir', 'name']))  # fields can be any iterable
+    ('Mic', 'Bob')
+    """
+    fields = fields if isinstance(fields, tuple) else tuple(fields)
+    if len(d) != len(fields):
+        raise KeyValidationError(f"len(d)={len(d)} but len(fields)={len(fields)}")
+    try:
+        return tuple(map(d.__getitem__, fields))
+    except KeyError as e:
+        raise KeyValidationError(f"Missing field: {e}")
+
+
+def mk_tuple_of_dict(fields):
+    """
+    Make a tuple_of_dict function for fixed fields.
+    The values are extracted with an operator.itemgetter, so in C, and in one go.
+    :param fields: the (ordered) fields to extract
+    :return: a function that makes a tuple from a dict
+    >>> tuple_of_dict = mk_tuple_of_dict(['dir', 'name'])
+    >>> tuple_of_dict({'name': 'Bob', 'dir': 'Mic'})
+    ('Mic', 'Bob')
+    >>> mk_tuple_of_dict(['name'])({'name': 'Bob'})  # still a tuple, even with a single field
+    ('Bob',)
+    >>> try:
+    ...     tuple_of_dict({'name': 'Bob', 'directory': 'Mic'})
+    ... except KeyValidationError:
+    ...     print("wrong fields")
+    wrong fields
+    """
+    fields = _intern_fields(fields)
+    n_fields = len(fields)
+    if n_fields == 0:
+        def _get(d):
+            return ()
+    elif n_fields == 1:
+        _field = fields[0]
+
+        def _get(d):
+            return (d[_field],)
+    else:
+        _get = itemgetter(*fields)  # returns a tuple when given several fields
+
+    def _tuple_of_dict(d):
+        if len(d) != n_fields:
+            raise KeyValidationError(f"len(d)={len(d)} but len(fields)={n_fields}")
+        try:
+            return _get(d)
+        except KeyError as e:
+            raise KeyValidationError(f"Missing field: {e}")
+
+    return _tuple_of_dict
+
+
+def dict_of_tuple(t, fields):
+    """
+    Make a dict from a tuple, pairing fields with values, in order.
+    :param t: the tuple of values
+    :param fields: the (ordered) fields to name the values of t with
+    :return: a {field: value, ...} dict
+    >>> dict_of_tuple(('Mic', 'Bob'), ('dir', 'name'))
+    {'dir': 'Mic', 'name': 'Bob'}
+    """
+    fields = fields if isinstance(fields, tuple) else tuple(fields)
+    if len(t) != len(fields):
+        raise KeyValidationError(f"len(t)={len(t)} but len(fields)={len(fields)}")
+    return dict(zip(fields, t))
+
+
+def mk_dict_of_tuple(fields):
+    """
+    Make a dict_of_tuple function for fixed fields.
+    :param fields: the (ordered) fields to name the values of tuples with
+    :return: a function that makes a dict from a tuple
+    >>> dict_of_tuple = mk_dict_of_tuple(['dir', 'name'])
+    >>> dict_of_tuple(('Mic', 'Bob'))
+    {'dir': 'Mic', 'name': 'Bob'}
+    >>> try:
+    ...     dict_of_tuple(('Mic',))
+    ... except KeyValidationError:
+    ...     print("wrong number of elements")
+    wrong number of elements
+    """
+    fields = _intern_fields(fields)
+    n_fields = len(fields)
+
+    def _dict_of_tuple(t):
+        if len(t) != n_fields:
+            raise KeyValidationError(f"len(t)={len(t)} but len(fields)={n_fields}")
+        return dict(zip(fields, t))
+
+    return _dict_of_tuple
+
+
+def tuple_of_str(s, compiled_regex):
+    """
+    Make a tuple from a string, using the groups of a regular expression.
+    :param s: the string to parse
+    :param compiled_regex: a compiled regular expression whose groups are the tuple's elements
+    :return: the tuple of matched groups
+    >>> tuple_of_str('Mic/Bob.txt', re.compile(r'([^/]+)/([^/]+)\\.txt$'))
+    ('Mic', 'Bob')
+    """
+    m = compiled_regex.match(s)
+    if m is None:
+        raise KeyValidationError(f"The string {s} didn't match the pattern {compiled_regex.pattern}")
+    return m.groups()
+
+
+def dict_of_str(s, compiled_regex):
+    """
+    Make a dict from a string, using the named groups of a regular expression.
+    :param s: the string to parse
+    :param compiled_regex: a compiled regular expression with named groups
+    :return: the {group_name: matched_string, ...} dict of matched groups
+    >>> dict_of_str('Mic/Bob.txt', re.compile(r'(?P<dir>[^/]+)/(?P<name>[^/]+)\\.txt$'))
+    {'dir': 'Mic', 'name': 'Bob'}
+    """
+    m = compiled_regex.match(s)
+    if m is None:
+        raise KeyValidationError(f"The string {s} didn't match the pattern {compiled_regex.pattern}")
+    return m.groupdict()
+
+
+def mk_tuple_of_str(pattern):
+    """
+    Make a tuple_of_str function for a fixed regular expression.
+    :param pattern: a regular expression (string or compiled) whose groups are the tuple's elements
+    :return: a function that makes a tuple from a string
+    >>> tuple_of_str = mk_tuple_of_str(r'([^/]+)/([^/]+)\\.txt$')
+    >>> tuple_of_str('Mic/Bob.txt')
+    ('Mic', 'Bob')
+    >>> try:
+    ...     tuple_of_str('Mic/Bob.wav')
+    ... except KeyValidationError as e:
+    ...     print(e)
+    The string Mic/Bob.wav didn't match the pattern ([^/]+)/([^/]+)\\.txt$
+    """
+    compiled_regex = re.compile(pattern)
+    _match = compiled_regex.match
+    _pattern = compiled_regex.pattern
+
+    def _tuple_of_str(s):
+        m = _match(s)
+        if m is None:
+            raise KeyValidationError(f"The string {s} didn't match the pattern {_pattern}")
+        return m.groups()
+
+    return _tuple_of_str
+
+
+def mk_dict_of_str(pattern):
+    """
+    Make a dict_of_str function for a fixed regular expression.
+    :param pattern: a regular expression (string or compiled) with named groups
+    :return: a function that makes a dict from a string
+    >>> dict_of_str = mk_dict_of_str(r'(?P<dir>[^/]+)/(?P<name>[^/]+)\\.txt$')
+    >>> dict_of_str('Mic/Bob.txt')
+    {'dir': 'Mic', 'name': 'Bob'}
+    """
+    compiled_regex = re.compile(pattern)
+    _match = compiled_regex.match
+    _pattern = compiled_regex.pattern
+
+    def _dict_of_str(s):
+        m = _match(s)
+        if m is None:
+            raise KeyValidationError(f"The string {s} didn't match the pattern {_pattern}")
+        # Note: Measured dict(zip(names, m.groups())), with names precomputed from groupindex: groupdict() was faster.
+        return m.groupdict()
+
+    return _dict_of_str
+
+
+def dsv_of_list(d, sep=','):
+    """
+    Make a (d)elimiter (s)eparated (v)alues string from a list of strings.
+    :param d: a list of strings
+    :param sep: the separator
+    :return: the dsv string
+    >>> dsv_of_list(['Mic', 'Bob', 'a.txt'], sep='/')
+    'Mic/Bob/a.txt'
+    """
+    return sep.join(d)
+
+
+def list_of_dsv(d, sep=','):
+    """
+    Make a list of strings from a (d)elimiter (s)eparated (v)alues string. The inverse of dsv_of_list.
+    :param d: a dsv string
+    :param sep: the separator
+    :return: the list of strings (an empty string gives an empty list)
+    >>> list_of_dsv('Mic/Bob/a.txt', sep='/')
+    ['Mic', 'Bob', 'a.txt']
+    >>> list_of_dsv('', sep='/')
+    []
+    """
+    return d.split(sep) if d else []
+
+
+def dsvs_of_lists(lists, sep=','):
+    """
+    Batch version of dsv_of_list: Make a list of dsv strings from an iterable of lists of strings.
+    :param lists: an iterable of lists of strings
+    :param sep: the separator
+    :return: a list of dsv strings
+    >>> dsvs_of_lists([['Mic', 'Bob'], ['Ann'], []], sep='/')
+    ['Mic/Bob', 'Ann', '']
+    """
+    return list(map(sep.join, lists))
+
+
+def lists_of_dsvs(dsvs, sep=','):
+    """
+    Batch version of list_of_dsv: Make a list of lists of strings from an iterable of dsv strings.
+    :param dsvs: an iterable of dsv strings
+    :param sep: the separator
+    :return: a list of lists of strings
+    >>> lists_of_dsvs(['Mic/Bob', 'Ann', ''], sep='/')
+    [['Mic', 'Bob'], ['Ann'], []]
+    """
+    return [d.split(sep) if d else [] for d in dsvs]
+
+
+def mk_list_of_dsv(sep=',', n=None, allow_empty=True):
+    """
+    Make a list_of_dsv function for a fixed separator, and optionally, a fixed number of elements.
+    :param sep: the separator
+    :param n: the number of elements the dsv strings must have. If given, the string is split at most n - 1 times
+        (so stops scanning after the last separator it needs), any further separators being left in the last element,
+        and a KeyValidationError is raised if there are less than n elements.
+        That includes the empty string (when allow_empty=True), which has 0 elements.
+    :param allow_empty: If True, as with list_of_dsv, an empty string gives an empty list (so, if n is given, a
+        KeyValidationError).
+        If False, there's no special handling of empty strings (so no check for it in every call): They're split like
+        any other string, so give [''] (and if n is given and more than 1, a KeyValidationError).
+        Use it when you know your dsv strings are never empty (e.g. file paths).
+    :return: a function that makes a list of strings from a dsv string
+    >>> list_of_dsv = mk_list_of_dsv('/')
+    >>> list_of_dsv('Mic/Bob/a.txt')
+    ['Mic', 'Bob', 'a.txt']
+    >>> list_of_dsv('')
+    []
+    >>> mk_list_of_dsv('/', allow_empty=False)('')
+    ['']
+    >>> list_of_dsv = mk_list_of_dsv('/', n=2)
+    >>> list_of_dsv('Mic/Bob/a.txt')
+    ['Mic', 'Bob/a.txt']
+    >>> try:
+    ...     list_of_dsv('Mic')
+    ... except KeyValidationError as e:
+    ...     print(e)
+    'Mic' has 1 '/'-separated elements, but should have 2
+    >>> try:
+    ...     list_of_dsv('')
+    ... except KeyValidationError as e:
+    ...     print(e)
+    '' has 0 '/'-separated elements, but should have 2
+    >>> mk_list_of_dsv('/', n=0)
+    Traceback (most recent call last):
+      ...
+    ValueError: n must be at least 1, was 0
+    """
+    if n is None:
+        if allow_empty:
+            def _list_of_dsv(d):
+                return d.split(sep) if d else []
+        else:
+            def _list_of_dsv(d):
+                return d.split(sep)
+    else:
+        if n < 1:
+            raise ValueError(f"n must be at least 1, was {n}")
+        maxsplit = n - 1
+
+        if allow_empty:
+            def _list_of_dsv(d):
+                parts = d.split(sep, maxsplit) if d else []
+                if len(parts) != n:
+                    raise KeyValidationError(f"{d!r} has {len(parts)} {sep!r}-separated elements, but should have {n}")
+                return parts
+        else:
+            def _list_of_dsv(d):
+                parts = d.split(sep, maxsplit)
+                if len(parts) != n:
+                    raise KeyValidationError(f"{d!r} has {len(parts)} {sep!r}-separated elements, but should have {n}")
+                return parts
+
+    return _list_of_dsv
+
+
+def mk_string_codec(str_format):
+    """
+    Make both directions of a tuple<->string key mapping from a single str.format template.
+    The inverse (decoding) regular expression is derived from the template, so there's no need to keep a separate
+    regex in sync with the template.
+    As with str.format, automatically numbered fields are the tuple's elements in the order they appear, and numbered
+    fields are the elements of that index. Named fields come after those, in the order they first appear.
+    A field that is repeated is the same element.
+    Note that decoding gives back strings, whatever the format specs of the fields are.
+    :param str_format: a str.format template (with named, numbered, or automatically numbered fields).
+        The following are not supported, and raise a ValueError:
+        compound field names (e.g. '{a.b}' or '{a[0]}'), nested fields in format specs (e.g. '{a:{width}}'),
+        mixing automatic and manual numbering (e.g. '{}_{0}'), gaps in the numbering (e.g. '{0}_{2}'), and
+        repeated fields with a different format spec or conversion (e.g. '{0:03d}_{0}'), since they couldn't be
+        decoded.
+    :return: an (str_of_tuple, tuple_of_str) pair of functions
+    >>> str_of_tuple, tuple_of_str = mk_string_codec('{dir}/{name}.txt')
+    >>> str_of_tuple(('Mic', 'Bob'))
+    'Mic/Bob.txt'
+    >>> tuple_of_str('Mic/Bob.txt')
+    ('Mic', 'Bob')
+    >>> try:
+    ...     tuple_of_str('Mic/Bob.txt\\n')  # the whole string must match (a trailing newline doesn't)
+    ... except KeyValidationError:
+    ...     print("no match")
+    no match
+    >>> str_of_tuple, tuple_of_str = mk_string_codec('{0}_{1:03d}-{0}.bin')  # a repeated field is the same element
+    >>> str_of_tuple(('Bob', 7))
+    'Bob_007-Bob.bin'
+    >>> tuple_of_str('Bob_007-Bob.bin')
+    ('Bob', '007')
+    >>> try:
+    ...     tuple_of_str('Bob_007-Alice.bin')
+    ... except KeyValidationError:
+    ...     print("no match")
+    no match
+    >>> str_of_tuple, tuple_of_str = mk_string_codec('{1}_{0}')  # numbered fields are the elements of that index
+    >>> str_of_tuple(('a', 'b'))  # as '{1}_{0}'.format('a', 'b') would
+    'b_a'
+    >>> tuple_of_str('b_a')
+    ('a', 'b')
+    >>> mk_string_codec('{}_{0}')
+    Traceback (most recent call last):
+      ...
+    ValueError: Can't mix automatic and manual field numbering: '{}_{0}'
+    >>> mk_string_codec('{0}_{2}')
+    Traceback (most recent call last):
+      ...
+    ValueError: The field numbers of '{0}_{2}' should be 0 to 1, without gaps
+    >>> mk_string_codec('{0:03d}_{0}')
+    Traceback (most recent call last):
+      ...
+    ValueError: Repeated field '0' must have the same format spec and conversion every time: '{0:03d}_{0}'
+    >>> mk_string_codec('{a}/{a!r}')
+    Traceback (most recent call last):
+      ...
+    ValueError: Repeated field 'a' must have the same format spec and conversion every time: '{a}/{a!r}'
+    """
+    parsed = []  # (literal, field, spec, conversion) items, with automatic numbering resolved
+    auto_idx = 0
+    has_manual_numbering = False
+    for literal, field, spec, conversion in Formatter().parse(str_format):
+        if field is not None:
+            if not (field == '' or field.isdigit() or field.isidentifier()):
+                raise ValueError(f"Only plain (identifier or number) field names are supported: {field!r}")
+            if '{' in spec:
+                raise ValueError(f"Nested fields in format specs are not supported: {spec!r}")
+            if field == '':
+                field = str(auto_idx)
+                auto_idx += 1
+            elif field.isdigit():
+                has_manual_numbering = True
+            if auto_idx and has_manual_numbering:
+                raise ValueError(f"Can't mix automatic and manual field numbering: {str_format!r}")
+        parsed.append((literal, field, spec, conversion))
+
+    # tuple index of each field: numbered fields are their number, named ones come after, in order of appearance
+    numbers = {int(field) for _, field, _, _ in parsed if field is not None and field.isdigit()}
+    if numbers != set(range(len(numbers))):
+        raise ValueError(f"The field numbers of {str_format!r} should be 0 to {len(numbers) - 1}, without gaps")
+    idx_of_field = {str(i): i for i in numbers}
+    for _, field, _, _ in parsed:
+        if field is not None and field not in idx_of_field:
+            idx_of_field[field] = len(idx_of_field)
+
+    format_parts = []
+    pattern_parts = []
+    first_occurrence = {}  # field: (group number, spec, conversion)
+    for literal, field, spec, conversion in parsed:
+        format_parts.append(literal.replace('{', '{{').replace('}', '}}'))
+        pattern_parts.append(re.escape(literal))
+        if field is None:
+            continue
+        if field in first_occurrence:
+            group_num, first_spec, first_conversion = first_occurrence[field]
+            if (spec, conversion) != (first_spec, first_conversion):
+                raise ValueError(f"Repeated field {field!r} must have the same format spec and conversion "
+                                 f"every time: {str_format!r}")
+            pattern_parts.append(f"(?:\\{group_num})")
+        else:
+            first_occurrence[field] = (len(first_occurrence) + 1, spec, conversion)
+            pattern_parts.append("(.+?)")
+        format_parts.append('{' + str(idx_of_field[field]) + (f'!{conversion}' if conversion else '')
+                            + (f':{spec}' if spec else '') + '}')
+
+    positional_format = ''.join(format_parts)
+    pattern = ''.join(pattern_parts) + r'\Z'
+    tuple_of_groups = mk_tuple_of_str(pattern)
+
+    # groups are in order of (first) appearance, so may need to be reordered into the tuple's order
+    fields_in_group_order = list(first_occurrence)
+    n_groups = len(fields_in_group_order)
+    group_idx_of_idx = sorted(range(n_groups), key=lambda g: idx_of_field[fields_in_group_order[g]])
+    if group_idx_of_idx == list(range(n_groups)):
+        tuple_of_str = tuple_of_groups
+    else:
+        _reorder = itemgetter(*group_idx_of_idx)  # there are at least two groups if they're not in order
+
+        def tuple_of_str(s):
+            return _reorder(tuple_of_groups(s))
+
+    return mk_str_of_tuple(positional_format), tuple_of_str
+
+
+def _test_dsv_of_list(n_tests=100, max_n_elements=10, max_element_length=5, max_sep_length=3):
+    """
+    Randomized test that list_of_dsv (and mk_list_of_dsv) inverts dsv_of_list
+    >>> _test_dsv_of_list()
+    """
+    element_chars = string.digits + string.ascii_lowercase
+    sep_chars = string.punctuation  # disjoint from element_chars, so separators never appear in elements
+    for _ in range(n_tests):
+        sep = ''.join(random.choices(sep_chars, k=random.randint(1, max_sep_length)))
+        element_lengths = random.choices(range(1, max_element_length + 1), k=random.randint(1, max_n_elements))
+        chars = ''.join(random.choices(element_chars, k=sum(element_lengths)))
+        elements = [chars[end - n:end] for n, end in zip(element_lengths, accumulate(element_lengths))]
+        dsv = dsv_of_list(elements, sep)
+        assert list_of_dsv(dsv, sep) == elements, f"{elements} -> {dsv!r} -> {list_of_dsv(dsv, sep)}"
+        assert mk_list_of_dsv(sep, n=len(elements))(dsv) == elements
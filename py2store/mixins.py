@@ -1,4 +1,5 @@
 from py2store.errors import WritesNotAllowed, DeletionsNotAllowed, OverWritesNotAllowedError
+from py2store.util import count_iter
 
 
 class IdentityKeysWrapMixin:
@@ -6,6 +7,7 @@ class IdentityKeysWrapMixin:
     This is useful in cases where the keys the persistence functions work with are the same as those you want to work
     with.
     """
+    __slots__ = ()
 
     def _id_of_key(self, k):
         """
@@ -30,6 +32,7 @@ class IdentityValsWrapMixin:
         This is useful in cases where the values can be persisted by __setitem__ as is (or the serialization is
         handled somewhere in the __setitem__ method.
     """
+    __slots__ = ()
 
     def _data_of_obj(self, v):
         """
@@ -50,7 +53,7 @@ class IdentityValsWrapMixin:
 
 class IdentityKvWrapMixin(IdentityKeysWrapMixin, IdentityValsWrapMixin):
     """Transparent Keys and Vals Wrap"""
-    pass
+    __slots__ = ()
 
 
 from functools import partial
@@ -59,6 +62,8 @@ encode_as_utf8 = partial(str, encoding='utf-8')
 
 
 class StringKvWrap(IdentityKvWrapMixin):
+    __slots__ = ()
+
     def _obj_of_data(self, v):
         return encode_as_utf8(v)
 
@@ -67,6 +72,7 @@ class FilteredKeysMixin:
     """
     Filters __iter__ and __contains__ with (the boolean filter function attribute) _key_filt.
     """
+    __slots__ = ()
 
     def __iter__(self):
         return filter(self._key_filt, super().__iter__())
@@ -86,6 +92,7 @@ class FilteredKeysMixin:
 
 class ReadOnlyMixin:
     """Put this as your first parent class to disallow write/delete operations"""
+    __slots__ = ()
 
     def __setitem__(self, k, v):
         raise WritesNotAllowed("You can't write with that Store")
@@ -116,6 +123,8 @@ class OverWritesNotAllowedMixin:
     ... else:
     ...     raise RuntimeWarning("Actually, we EXPECT for an OverWritesNotAllowedError to be raised")
     """
+    __slots__ = ()
+
     def __setitem__(self, k, v):
         if self.__contains__(k):
             raise OverWritesNotAllowedError(
@@ -128,6 +137,8 @@ class OverWritesNotAllowedMixin:
 # Mixins to define mapping methods from others
 
 class GetBasedContainerMixin:
+    __slots__ = ()
+
     def __contains__(self, k) -> bool:
         """
         Check if collection of keys contains k.
@@ -143,6 +154,8 @@ class GetBasedContainerMixin:
 
 
 class IterBasedContainerMixin:
+    __slots__ = ()
+
     def __contains__(self, k) -> bool:
         """
         Check if collection of keys contains k.
@@ -150,13 +163,91 @@ class IterBasedContainerMixin:
         Therefore it is not efficient, and in most cases should be overridden with a more efficient version.
         :return: True if k is in the collection, and False if not
         """
+        # Note: Found that any(collection_key == k for ...) was about twice as slow as this explicit loop.
         for collection_key in self.__iter__():
             if collection_key == k:
                 return True
         return False  # return False if the key wasn't found
 
 
+_unhashable_keys = object()  # CachedKeysContainerMixin._keys_cache sentinel for "keys can't be put in a set"
+
+
+class CachedKeysContainerMixin:
+    """
+    Mixin for __contains__ to check against a set of the keys, made (by iterating over the keys) the first time it's
+    needed. Writes and deletes made through __setitem__ and __delitem__ invalidate that set.
+    Meant for read-heavy use, where iteration is the only way to check for containment: Instead of an iteration per
+    __contains__ call, there's one per write.
+
+    Only use it over a collections.abc.MutableMapping (e.g. Persister) derived class, whose other write methods
+    (pop, popitem, update, setdefault...) all go through __setitem__ and __delitem__.
+    Over a class that implements those natively (e.g. dict), the set will go stale.
+    Of course, writes made to the underlying storage by other means won't be seen either.
+    Call _invalidate_keys_cache() if you need to.
+
+    If the keys (or the k being checked) aren't hashable, __contains__ falls back to iterating over the keys
+    (as IterBasedContainerMixin does).
+
+    Note: Should be before the persister in the MRO.
+
+    >>> from py2store.base import Persister
+    >>> class DictPersister(Persister):
+    ...     def __init__(self, **kwargs):
+    ...         self.d = dict(**kwargs)
+    ...     def __getitem__(self, k):
+    ...         return self.d[k]
+    ...     def __setitem__(self, k, v):
+    ...         self.d[k] = v
+    ...     def __delitem__(self, k):
+    ...         del self.d[k]
+    ...     def __iter__(self):
+    ...         return iter(self.d)
+    >>> class TestPersister(CachedKeysContainerMixin, DictPersister):
+    ...     pass
+    >>> p = TestPersister(foo='bar')
+    >>> 'foo' in p, 'hello' in p
+    (True, False)
+    >>> p.update(hello='world')
+    >>> 'hello' in p
+    True
+    >>> _ = p.pop('foo')
+    >>> 'foo' in p
+    False
+    >>> ['a', 'b'] in p  # an unhashable k is checked by iterating over the keys
+    False
+    """
+    _keys_cache = None
+
+    def __contains__(self, k) -> bool:
+        keys_cache = self._keys_cache
+        if keys_cache is None:
+            try:
+                keys_cache = self._keys_cache = set(self.__iter__())
+            except TypeError:  # unhashable keys: remember it, so as to not try again (until invalidated)
+                keys_cache = self._keys_cache = _unhashable_keys
+        if keys_cache is _unhashable_keys:
+            return IterBasedContainerMixin.__contains__(self, k)
+        try:
+            return k in keys_cache
+        except TypeError:  # unhashable k
+            return IterBasedContainerMixin.__contains__(self, k)
+
+    def _invalidate_keys_cache(self):
+        self._keys_cache = None
+
+    def __setitem__(self, k, v):
+        super().__setitem__(k, v)
+        self._invalidate_keys_cache()
+
+    def __delitem__(self, k):
+        super().__delitem__(k)
+        self._invalidate_keys_cache()
+
+
 class IterBasedSizedMixin:
+    __slots__ = ()
+
     def __len__(self) -> int:
         """
         Number of elements in collection of keys.
@@ -166,10 +257,8 @@ class IterBasedSizedMixin:
         """
         # TODO: some other means to more quickly count files?
         # Note: Found that sum(1 for _ in self.__iter__()) was slower for small, slightly faster for big inputs.
-        count = 0
-        for _ in self.__iter__():
-            count += 1
-        return count
+        # count_iter does the counting in C, and beats both.
+        return count_iter(self.__iter__())
 
 
 class IterBasedSizedContainerMixin(IterBasedSizedMixin, IterBasedContainerMixin):
@@ -188,10 +277,12 @@ class IterBasedSizedContainerMixin(IterBasedSizedMixin, IterBasedContainerMixin)
     offers mixin __len__ and __contains__ methods based on a given __iter__ method.
     Note that usually __len__ and __contains__ should be overridden to more, context-dependent, efficient methods.
     """
-    pass
+    __slots__ = ()
 
 
 class HashableMixin:
+    __slots__ = ()
+
     def __hash__(self):
         return id(self)
 
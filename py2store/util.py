@@ -1,5 +1,7 @@
 import os
 import shutil
+from collections import deque
+from itertools import count
 
 
 def fill_with_dflts(d, dflt_dict=None):
@@ -120,6 +122,25 @@ def max_common_prefix(a):
     return s1
 
 
+def count_iter(iterable):
+    """
+    Count the number of items of an iterable, consuming it.
+    The iteration happens in C (a zero-length deque consuming a zip with a counter), so no python-level loop is
+    involved, and no items are kept around.
+    :param iterable: any iterable
+    :return: the number (int) of items the iterable yielded
+    >>> count_iter(iter([3, 1, 4, 1, 5]))
+    5
+    >>> count_iter(x for x in 'abc' if x != 'b')
+    2
+    >>> count_iter([])
+    0
+    """
+    counter = count()
+    deque(zip(iterable, counter), maxlen=0)
+    return next(counter)
+
+
 class SimpleProperty(object):
     def __get__(self, obj, objtype=None):
         return obj.d